@@ -18,25 +18,69 @@ Author: Advanced Analysis Tool
 Date: September 2025
 """
 
+import json
+import math
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import repeat
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 from pathlib import Path
 from dataclasses import dataclass
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 import warnings
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Optional - without pyarrow the Excel file is read every run
+    pa = None
+
+try:
+    from numba import njit
+except ImportError:  # Optional - the calibration kernels then run as plain Python
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
 warnings.filterwarnings("ignore")
 
-# Professional plotting style
-plt.rcParams["figure.figsize"] = (12, 8)
-plt.rcParams["font.size"] = 11
-plt.rcParams["axes.titlesize"] = 14
-plt.rcParams["axes.labelsize"] = 12
-plt.rcParams["xtick.labelsize"] = 10
-plt.rcParams["ytick.labelsize"] = 10
-plt.rcParams["legend.fontsize"] = 10
+
+# Professional plotting style, applied around each summary figure only
+_PLOT_STYLE = {
+    "figure.figsize": (12, 8),
+    "font.size": 11,
+    "axes.titlesize": 14,
+    "axes.labelsize": 12,
+    "xtick.labelsize": 10,
+    "ytick.labelsize": 10,
+    "legend.fontsize": 10,
+}
+
+
+def _import_pyplot():
+    """Import matplotlib on first plot only - keeps it out of module startup"""
+    import matplotlib
+
+    # No display available: pick Agg directly instead of probing GUI backends
+    if (
+        "matplotlib.pyplot" not in sys.modules
+        and "MPLBACKEND" not in os.environ
+        and os.name == "posix"
+        and sys.platform != "darwin"
+        and not (os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
+    ):
+        matplotlib.use("Agg", force=False)
+
+    import matplotlib.pyplot as plt
+
+    return plt
 
 
 @dataclass
@@ -65,15 +109,171 @@ class ScenarioSummary:
     range_span: float
 
 
+# Fast-math without "nnan"/"ninf": the failure paths rely on NaN/inf checks
+_FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+
+@njit(cache=True, nogil=True)
+def _terms(S1: float, S2: float, S3: float) -> Tuple[float, float, float]:
+    """Differences and discriminant of the 3-point solve, (S1-S3, S2-S3, disc.)"""
+    term1 = S1 - S3
+    term2 = S2 - S3
+    term3 = S1 - S2
+    return term1, term2, term1**2 - 4 * term2 * term3
+
+
+@njit(cache=True, nogil=True)
+def _feasible(term2: float, discriminant: float) -> bool:
+    """Whether the 3-point exponential solve has a solution, given _terms()"""
+    # Real discriminant and a non-zero denominator 2*(S2-S3)
+    return discriminant >= 0 and abs(2 * term2) >= 1e-10
+
+
+# No fast-math for the 3-point solve: one ln() root is 1 up to rounding, and
+# the discriminant is a perfect square, so its branches need exact IEEE arithmetic
+@njit(cache=True, nogil=True)
+def _calib(
+    S1: float, S2: float, S3: float, X1: float, X2: float, X3: float
+) -> Tuple[float, float, float]:
+    """Three-point exponential calibration, returns (A, B, C) or zeros on failure"""
+    # Scalars only - math.* avoids NumPy's 0-d array overhead without Numba
+    term1, term2, discriminant = _terms(S1, S2, S3)
+    if not _feasible(term2, discriminant):
+        return 0.0, 0.0, 0.0
+
+    sqrt_discriminant = math.sqrt(discriminant)
+
+    # Apply the correct formula from original code
+    denominator = 2 * term2  # 2*(S2-S3)
+
+    # Calculate the two possible arguments for the natural logarithm
+    numerator_plus = term1 + sqrt_discriminant  # (S1-S3) + SQRT(...)
+    numerator_minus = term1 - sqrt_discriminant  # (S1-S3) - SQRT(...)
+
+    # Calculate the arguments for ln() - this is the complete fraction inside ln()
+    ln_arg_plus = numerator_plus / denominator
+    ln_arg_minus = numerator_minus / denominator
+
+    # For decreasing ROS sensors, we want B > 0, i.e. a ln() argument above 1 -
+    # pick the root first so only one logarithm is evaluated
+    if ln_arg_plus > 1:
+        ln_arg = ln_arg_plus
+    elif ln_arg_minus > 1:
+        ln_arg = ln_arg_minus
+    else:
+        return 0.0, 0.0, 0.0
+
+    # Calculate B using the natural logarithm - NO DIVISION BY (X1-X3)!
+    B = math.log(ln_arg)
+
+    # exp(-B*X) at the three calibration points, each evaluated once
+    exp_neg_BX1 = math.exp(-B * X1)
+    exp_neg_BX2 = math.exp(-B * X2)
+    exp_neg_BX3 = math.exp(-B * X3)
+
+    # Calculate A using: A = (S1-S3)/(exp(-B*X1)-exp(-B*X3))
+    denominator_A = exp_neg_BX1 - exp_neg_BX3
+
+    if abs(denominator_A) < 1e-10:
+        return 0.0, 0.0, 0.0
+
+    A = (S1 - S3) / denominator_A
+
+    # Calculate C using: C = S2 - A*exp(-B*X2)
+    C = S2 - A * exp_neg_BX2
+
+    return A, B, C
+
+
+@njit(cache=True, nogil=True, fastmath=_FASTMATH)
+def _eval(
+    readings: np.ndarray, distances: np.ndarray, A: float, B: float, C: float
+) -> Tuple[float, float]:
+    """Bias-removed RMS error and R² of a calibration, (inf, -1) on failure"""
+    if A == 0 or B == 0:
+        return np.inf, -1.0
+
+    # Calculate predicted distances for all readings at once
+    argument = (readings - C) / A
+    valid_mask = argument > 0
+
+    # Remove invalid values
+    valid_predicted = -np.log(argument[valid_mask]) / B
+    valid_actual = distances[valid_mask]
+
+    n = valid_predicted.size
+    if n == 0:
+        return np.inf, -1.0
+
+    # Calculate errors (bias removed) from running sums - no temporary arrays
+    errors = valid_predicted - valid_actual
+    sum_e = errors.sum()
+    ss_res = max(np.dot(errors, errors) - sum_e * sum_e / n, 0.0)
+    rms_error = math.sqrt(ss_res / n)
+
+    # Calculate R²
+    sum_y = valid_actual.sum()
+    ss_tot = np.dot(valid_actual, valid_actual) - sum_y * sum_y / n
+    r_squared = 1 - (ss_res / ss_tot) if ss_tot != 0 else 0.0
+
+    return rms_error, r_squared
+
+
+@njit(cache=True, nogil=True)
+def _eval_scenarios(
+    scenario_readings: np.ndarray,
+    scenario_points: np.ndarray,
+    readings: np.ndarray,
+    distances: np.ndarray,
+) -> np.ndarray:
+    """Calibrate and evaluate all scenarios of one sensor -> (n, 2) of (rms, r2)"""
+    n_scenarios = scenario_points.shape[0]
+    out = np.empty((n_scenarios, 2))
+
+    for j in range(n_scenarios):
+        A, B, C = _calib(
+            scenario_readings[j, 0],
+            scenario_readings[j, 1],
+            scenario_readings[j, 2],
+            scenario_points[j, 0],
+            scenario_points[j, 1],
+            scenario_points[j, 2],
+        )
+        rms_error, r_squared = _eval(readings, distances, A, B, C)
+        out[j, 0] = rms_error
+        out[j, 1] = r_squared
+
+    return out
+
+
+def _exp_model(x: np.ndarray, A: float, B: float, C: float) -> np.ndarray:
+    """Exponential sensor model S = A*exp(-B*x) + C"""
+    return A * np.exp(-B * x) + C
+
+
+def _exp_model_jac(x: np.ndarray, A: float, B: float, C: float) -> np.ndarray:
+    """Analytic Jacobian of _exp_model with respect to (A, B, C)"""
+    exp_neg_Bx = np.exp(-B * x)
+    return np.column_stack((exp_neg_Bx, -A * x * exp_neg_Bx, np.ones_like(x)))
+
+
 class RangeCalibrationAnalyzer:
     """Simple, focused calibration range analyzer"""
 
-    def __init__(self, excel_file_path: str, sheet_name: str = "all raw"):
-        """Initialize analyzer"""
+    def __init__(
+        self, excel_file_path: str, sheet_name: str = "all raw", debug: bool = False
+    ):
+        """Initialize analyzer (debug=True prints per-scenario diagnostics)"""
         self.excel_file = excel_file_path
         self.sheet_name = sheet_name
+        self.debug = debug
+        self.cache_file = Path(excel_file_path).with_suffix(".parquet")
         self.sensors = {}
-        self.results = {}
+        self.results = pd.DataFrame()  # One row per (sensor, scenario) result
+        self.rms = None  # RMS error per (sensor, scenario), set by run_all_scenarios()
+        self.r2 = None  # R² per (sensor, scenario), set by run_all_scenarios()
+        self._header_df = None  # Sheet header rows, read once per load_all_sensors()
+        self._data_df = None  # Sheet numeric data, read once per load_all_sensors()
 
         # Test scenarios
         self.scenarios = {
@@ -90,30 +290,120 @@ class RangeCalibrationAnalyzer:
         print(f"📁 File: {excel_file_path}")
         print(f"📊 Scenarios: {len(self.scenarios)}")
 
+    def _read_cache(self) -> Optional[Tuple[pd.DataFrame, pd.DataFrame]]:
+        """Read the Parquet cache if it is up to date with the Excel file"""
+        if pa is None or not self.cache_file.exists():
+            return None
+
+        try:
+            if self.cache_file.stat().st_mtime < Path(self.excel_file).stat().st_mtime:
+                return None
+
+            table = pq.read_table(self.cache_file)
+            metadata = table.schema.metadata or {}
+            if metadata.get(b"sheet_name", b"").decode() != self.sheet_name:
+                return None
+
+            # Header rows are stored as JSON so the sensor name logic sees raw cells
+            header_df = pd.DataFrame(json.loads(metadata[b"header_rows"]))
+            data_df = table.to_pandas()
+            print(f"   Using cached data: {self.cache_file.name}")
+            return header_df, data_df
+
+        except Exception as e:
+            print(f"   ⚠️ Ignoring unreadable cache {self.cache_file.name}: {e}")
+            return None
+
+    def _write_cache(self, header_df: pd.DataFrame, data_df: pd.DataFrame) -> None:
+        """Write the parsed sheet next to the Excel file for faster re-runs"""
+        if pa is None:
+            return
+
+        try:
+            table = pa.Table.from_pandas(
+                data_df.rename(columns=str), preserve_index=False
+            )
+            metadata = dict(table.schema.metadata or {})
+            metadata[b"sheet_name"] = self.sheet_name.encode()
+            metadata[b"header_rows"] = json.dumps(
+                header_df.values.tolist(), default=str
+            ).encode()
+            table = table.replace_schema_metadata(metadata)
+            pq.write_table(table, self.cache_file, compression="zstd")
+
+        except Exception as e:
+            print(f"   ⚠️ Could not write cache {self.cache_file.name}: {e}")
+
+    def _read_sheet(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """Read the sheet header and numeric data once for every sensor column"""
+        if self._data_df is None:
+            cached = self._read_cache()
+            if cached is not None:
+                self._header_df, self._data_df = cached
+                return cached
+
+            # Two header rows below the title row (Excel rows 2-3), columns A-E only
+            self._header_df = pd.read_excel(
+                self.excel_file,
+                sheet_name=self.sheet_name,
+                usecols="A:E",
+                skiprows=1,
+                nrows=2,
+                header=None,
+                engine="openpyxl",
+            )
+            # Numeric data from Excel row 4 onwards, typed on read
+            data_kwargs = dict(
+                sheet_name=self.sheet_name,
+                usecols="A:E",
+                skiprows=3,
+                header=None,
+                na_values=[""],
+                engine="openpyxl",
+            )
+            try:
+                self._data_df = pd.read_excel(
+                    self.excel_file, dtype=np.float64, **data_kwargs
+                )
+            except ValueError:
+                # Non-numeric cells (Excel errors, notes) - read as objects and
+                # coerce the whole block once, bad cells become NaN
+                self._data_df = (
+                    pd.read_excel(self.excel_file, dtype=object, **data_kwargs)
+                    .apply(pd.to_numeric, errors="coerce")
+                    .astype(np.float64)
+                )
+            self._write_cache(self._header_df, self._data_df)
+
+        return self._header_df, self._data_df
+
     def load_sensor_data(self, column: str) -> Dict:
         """Load sensor data from Excel column using proven method from original code"""
         try:
-            # Read the Excel file
-            df_raw = pd.read_excel(self.excel_file, sheet_name=self.sheet_name)
+            # Read the Excel file (cached after the first column)
+            header_df, data_df = self._read_sheet()
 
             # Get column index
             col_index = ord(column.upper()) - ord("A")  # Convert A,B,C,D,E to 0,1,2,3,4
 
             # Get sensor name from row 2 (index 1) - the actual header row
-            if col_index < df_raw.shape[1] and len(df_raw) > 1:
-                sensor_name = df_raw.iloc[1, col_index]  # Row 2 contains sensor names
-                print(
-                    f"   Sensor name from header (row 2, column {column}): {sensor_name}"
-                )
+            if col_index < header_df.shape[1] and len(header_df) > 1:
+                # Row 2 contains sensor names
+                sensor_name = header_df.iloc[1, col_index]
+                if self.debug:
+                    print(
+                        f"   Sensor name from header (row 2, column {column}): {sensor_name}"
+                    )
 
                 # Clean the sensor name
                 if (
                     pd.isna(sensor_name)
                     or str(sensor_name).replace(".", "").replace(",", "").isdigit()
                 ):
-                    if len(df_raw) > 0:
-                        sensor_name = df_raw.iloc[0, col_index]
-                        print(f"   Trying row 1 instead: {sensor_name}")
+                    if len(header_df) > 0:
+                        sensor_name = header_df.iloc[0, col_index]
+                        if self.debug:
+                            print(f"   Trying row 1 instead: {sensor_name}")
 
                     if (
                         pd.isna(sensor_name)
@@ -127,40 +417,38 @@ class RangeCalibrationAnalyzer:
                 sensor_name = f"Sensor_{column}"
                 print(f"   Could not read sensor name, using default: {sensor_name}")
 
-            # Start reading data from row 3 (index 2) onwards - skip header rows
-            data_start_row = 2
-
-            # Extract distance (column A) and sensor data (specified column)
-            distance_data = df_raw.iloc[data_start_row:, 0]  # Column A - distance
-            sensor_data = df_raw.iloc[
-                data_start_row:, col_index
-            ]  # Specified column - sensor reading
+            # Extract distance (column A) and sensor data (specified column) -
+            # _read_sheet returns a float64 block, typed on read or coerced
+            data = data_df.to_numpy(dtype=np.float64, copy=False)
+            distances = data[:, 0]  # Column A - distance
+            readings = data[:, col_index]  # Specified column - reading
 
-            # Convert to numeric and remove NaN values
-            distance_numeric = pd.to_numeric(distance_data, errors="coerce")
-            sensor_numeric = pd.to_numeric(sensor_data, errors="coerce")
+            # Remove rows with missing or non-numeric (coerced to NaN) values
+            # and filter to distance <= 4
+            mask = np.isfinite(distances) & np.isfinite(readings) & (distances <= 4.0)
+            distances = distances[mask]
+            readings = readings[mask]
 
-            # Create DataFrame and remove rows with NaN values
-            df = pd.DataFrame(
-                {"distance": distance_numeric, "sensor_reading": sensor_numeric}
-            ).dropna()
-
-            # Filter to distance <= 4
-            df = df[df["distance"] <= 4].copy()
-
-            print(f"   ✅ Loaded {len(df)} data points for {sensor_name}")
-            if len(df) > 0:
+            print(f"   ✅ Loaded {len(distances)} data points for {sensor_name}")
+            if len(distances) > 0:
                 print(
-                    f"      Distance range: {df['distance'].min():.3f} - {df['distance'].max():.3f} mm"
+                    f"      Distance range: {distances.min():.3f} - {distances.max():.3f} mm"
                 )
                 print(
-                    f"      Reading range: {df['sensor_reading'].min():.0f} - {df['sensor_reading'].max():.0f}"
+                    f"      Reading range: {readings.min():.0f} - {readings.max():.0f}"
                 )
 
+            # Sort once by distance - np.interp needs increasing x values
+            order = np.argsort(distances, kind="stable")
+            distances = distances[order]
+            readings = readings[order]
+
             return {
                 "name": sensor_name,
-                "distances": df["distance"].values,
-                "readings": df["sensor_reading"].values,
+                "distances": distances,
+                "readings": readings,
+                # Linear interpolation over the sorted data, reused for every query
+                "interp": partial(np.interp, xp=distances, fp=readings),
             }
 
         except Exception as e:
@@ -171,6 +459,10 @@ class RangeCalibrationAnalyzer:
         """Load all sensors"""
         print(f"\n📡 Loading sensors from columns: {columns}")
 
+        # Parse the workbook once, shared by all columns below
+        self._header_df = None
+        self._data_df = None
+
         for column in columns:
             sensor_data = self.load_sensor_data(column)
             self.sensors[sensor_data["name"]] = sensor_data
@@ -183,78 +475,62 @@ class RangeCalibrationAnalyzer:
     def calculate_exponential_calibration(
         self, sensor_readings: List[float], distances: List[float]
     ) -> Dict[str, float]:
-        """Calculate exponential calibration parameters - EXACT copy from working original code"""
+        """Calibration parameters from the compiled _calib solve, warns if not decreasing"""
         S1, S2, S3 = sensor_readings
         X1, X2, X3 = distances
 
         # Check sensor behavior - for ROS, readings should decrease with distance
-        if S1 < S2 or S2 < S3:
-            print(
-                f"   WARNING: Sensor readings should decrease with distance for ROS sensors!"
-            )
-            print(
-                f"   S1={S1:.1f} at {X1}mm, S2={S2:.1f} at {X2}mm, S3={S3:.1f} at {X3}mm"
-            )
-
-        # Calculate terms
-        term1 = S1 - S3
-        term2 = S2 - S3
-        term3 = S1 - S2
+        self._warn_if_not_decreasing(sensor_readings, distances)
 
-        # Calculate discriminant
-        discriminant = term1**2 - 4 * term2 * term3
-
-        if discriminant < 0:
-            return {"A": 0, "B": 0, "C": 0}
-
-        sqrt_discriminant = np.sqrt(discriminant)
-
-        # Apply the correct formula from original code
-        denominator = 2 * term2  # 2*(S2-S3)
-        if abs(denominator) < 1e-10:
-            return {"A": 0, "B": 0, "C": 0}
-
-        # Calculate the two possible arguments for the natural logarithm
-        numerator_plus = term1 + sqrt_discriminant  # (S1-S3) + SQRT(...)
-        numerator_minus = term1 - sqrt_discriminant  # (S1-S3) - SQRT(...)
-
-        # Calculate the arguments for ln() - this is the complete fraction inside ln()
-        ln_arg_plus = numerator_plus / denominator
-        ln_arg_minus = numerator_minus / denominator
-
-        # Calculate B values using the natural logarithm - NO DIVISION BY (X1-X3)!
-        B_plus = np.log(ln_arg_plus) if ln_arg_plus > 0 else np.nan
-        B_minus = np.log(ln_arg_minus) if ln_arg_minus > 0 else np.nan
+        A, B, C = _calib(S1, S2, S3, X1, X2, X3)
+        return {"A": A, "B": B, "C": C}
 
-        # For decreasing ROS sensors, we want B > 0
-        if not np.isnan(B_plus) and B_plus > 0:
-            B = B_plus
-        elif not np.isnan(B_minus) and B_minus > 0:
-            B = B_minus
-        else:
-            return {"A": 0, "B": 0, "C": 0}
+    def calibrate_fit(
+        self, sensor_data: Dict[str, np.ndarray], points: List[float]
+    ) -> Dict[str, float]:
+        """Least-squares fit on all data points, seeded by the 3-point solve"""
+        from scipy.optimize import curve_fit
 
-        # Calculate A using: A = (S1-S3)/(exp(-B*X1)-exp(-B*X3))
-        exp_neg_BX1 = np.exp(-B * X1)
-        exp_neg_BX3 = np.exp(-B * X3)
+        distances = sensor_data["distances"]
+        readings = sensor_data["readings"]
 
-        denominator_A = exp_neg_BX1 - exp_neg_BX3
+        # Initial guess from the 3-point calibration at the given points
+        S1, S2, S3 = sensor_data["interp"](points)
+        p0 = _calib(S1, S2, S3, *points)
+        if p0[1] == 0:
+            # 3-point solve failed - fall back to a rough decay guess
+            p0 = (readings.max() - readings.min(), 1.0, readings.min())
 
-        if abs(denominator_A) < 1e-10:
-            return {"A": 0, "B": 0, "C": 0}
+        try:
+            popt, _ = curve_fit(
+                _exp_model, distances, readings, p0=p0, jac=_exp_model_jac
+            )
+        except (RuntimeError, ValueError) as e:
+            print(f"   WARNING: Exponential fit did not converge: {e}")
+            return {"A": 0.0, "B": 0.0, "C": 0.0}
 
-        A = (S1 - S3) / denominator_A
+        A, B, C = popt
+        return {"A": float(A), "B": float(B), "C": float(C)}
 
-        # Calculate C using: C = S2 - A*exp(-B*X2)
-        exp_neg_BX2 = np.exp(-B * X2)
-        C = S2 - A * exp_neg_BX2
+    def _warn_if_not_decreasing(
+        self, sensor_readings: List[float], distances: List[float]
+    ) -> None:
+        """Warn when calibration readings do not decrease with distance"""
+        S1, S2, S3 = sensor_readings
+        X1, X2, X3 = distances
 
-        return {"A": A, "B": B, "C": C}
+        if S1 < S2 or S2 < S3:
+            print(
+                f"   WARNING: Sensor readings should decrease with distance for ROS sensors!"
+            )
+            print(
+                f"   S1={S1:.1f} at {X1}mm, S2={S2:.1f} at {X2}mm, S3={S3:.1f} at {X3}mm"
+            )
 
     def calculate_distance_from_reading(
         self, sensor_reading: float, params: Dict[str, float]
     ) -> float:
-        """Calculate distance from sensor reading"""
+        """Calculate distance from a single sensor reading (scalar helper)"""
         A, B, C = params["A"], params["B"], params["C"]
 
         if A == 0 or B == 0:
@@ -271,34 +547,13 @@ class RangeCalibrationAnalyzer:
         self, sensor_data: Dict[str, np.ndarray], params: Dict[str, float]
     ) -> Tuple[float, float]:
         """Evaluate calibration performance"""
-        predicted_distances = []
-
-        # Calculate predicted distances
-        for reading in sensor_data["readings"]:
-            predicted = self.calculate_distance_from_reading(reading, params)
-            predicted_distances.append(predicted)
-
-        predicted_distances = np.array(predicted_distances)
-        actual_distances = sensor_data["distances"]
-
-        # Remove invalid values
-        valid_mask = ~np.isnan(predicted_distances)
-        valid_predicted = predicted_distances[valid_mask]
-        valid_actual = actual_distances[valid_mask]
-
-        if len(valid_predicted) == 0:
-            return float("inf"), -1.0
-
-        # Calculate errors (bias removed)
-        errors = valid_predicted - valid_actual
-        mean_error = np.mean(errors)
-        bias_removed_errors = errors - mean_error
-        rms_error = np.sqrt(np.mean(bias_removed_errors**2))
-
-        # Calculate R²
-        ss_res = np.sum(bias_removed_errors**2)
-        ss_tot = np.sum((valid_actual - np.mean(valid_actual)) ** 2)
-        r_squared = 1 - (ss_res / ss_tot) if ss_tot != 0 else 0.0
+        rms_error, r_squared = _eval(
+            sensor_data["readings"],
+            sensor_data["distances"],
+            params["A"],
+            params["B"],
+            params["C"],
+        )
 
         return float(rms_error), float(r_squared)
 
@@ -309,18 +564,31 @@ class RangeCalibrationAnalyzer:
         sensor_data = self.sensors[sensor_name]
 
         # Interpolate sensor readings at calibration points
-        sensor_readings = np.interp(
-            points, sensor_data["distances"], sensor_data["readings"]
-        )
+        sensor_readings = sensor_data["interp"](points)
+
+        # Skip calibration and evaluation when no 3-point solution exists
+        _, term2, discriminant = _terms(*sensor_readings)
+        if not _feasible(term2, discriminant):
+            self._warn_if_not_decreasing(sensor_readings, points)
+            return ScenarioResult(
+                scenario_name=scenario_name,
+                points=points,
+                rms_error=float("inf"),
+                r_squared=-1.0,
+                range_span=points[2] - points[0],
+                sensor_name=sensor_name,
+            )
 
-        print(f"         DEBUG: Points {points} -> Readings {sensor_readings}")
+        if self.debug:
+            print(f"         DEBUG: Points {points} -> Readings {sensor_readings}")
 
         # Calculate calibration parameters
         params = self.calculate_exponential_calibration(sensor_readings, points)
 
-        print(
-            f"         DEBUG: Params A={params['A']:.2e}, B={params['B']:.6f}, C={params['C']:.2e}"
-        )
+        if self.debug:
+            print(
+                f"         DEBUG: Params A={params['A']:.2e}, B={params['B']:.6f}, C={params['C']:.2e}"
+            )
 
         # Evaluate performance
         rms_error, r_squared = self.evaluate_calibration_performance(
@@ -336,67 +604,135 @@ class RangeCalibrationAnalyzer:
             sensor_name=sensor_name,
         )
 
+    def _interpolate_scenarios(self, scenario_points: np.ndarray) -> np.ndarray:
+        """Readings of all sensors at the scenario points, (n_sensors, n_scenarios, 3)"""
+        all_points = scenario_points.ravel()
+        sensors = list(self.sensors.values())
+        if not sensors:
+            return np.empty((0,) + scenario_points.shape)
+
+        # Sensors measured on one strictly increasing distance grid share the lookup
+        d = sensors[0]["distances"]
+        shared_grid = (
+            d.size > 1
+            and np.all(np.diff(d) > 0)
+            and all(np.array_equal(s["distances"], d) for s in sensors[1:])
+        )
+
+        if shared_grid:
+            R = np.vstack([s["readings"] for s in sensors])
+
+            # Same end clamping as np.interp
+            idx = np.searchsorted(d, all_points, side="right") - 1
+            idx = np.clip(idx, 0, d.size - 2)
+            w = np.clip((all_points - d[idx]) / (d[idx + 1] - d[idx]), 0.0, 1.0)
+            readings_at = R[:, idx] + w * (R[:, idx + 1] - R[:, idx])
+        else:
+            readings_at = np.array([s["interp"](all_points) for s in sensors])
+
+        return readings_at.reshape((len(sensors),) + scenario_points.shape)
+
     def run_all_scenarios(self) -> None:
         """Run all calibration scenarios for all sensors"""
         print(f"\n🔬 Running calibration range analysis...")
         print(f"   Sensors: {len(self.sensors)}")
         print(f"   Scenarios: {len(self.scenarios)}")
 
-        all_results = []
+        # All scenarios' calibration points, one row per scenario
+        scenario_points = np.array(list(self.scenarios.values()), dtype=float)
+
+        # Results as (n_sensors, n_scenarios) arrays
+        self.rms = np.full((len(self.sensors), len(self.scenarios)), np.nan)
+        self.r2 = np.full_like(self.rms, np.nan)
+
+        # Sensor readings at every scenario's points, all sensors at once
+        all_readings = self._interpolate_scenarios(scenario_points)
+
+        # Sensors are independent - calibrate + evaluate them concurrently,
+        # the compiled kernels release the GIL
+        sensors = list(self.sensors.values())
+        with ThreadPoolExecutor(max_workers=max(1, min(4, len(sensors)))) as pool:
+            performances = list(
+                pool.map(
+                    _eval_scenarios,
+                    all_readings,
+                    repeat(scenario_points),
+                    [sensor_data["readings"] for sensor_data in sensors],
+                    [sensor_data["distances"] for sensor_data in sensors],
+                )
+            )
+
+        for i, sensor_name in enumerate(self.sensors.keys()):
+            performance = performances[i]
+            self.rms[i] = performance[:, 0]
+            self.r2[i] = performance[:, 1]
 
-        for sensor_name in self.sensors.keys():
             print(f"\n   📊 Testing {sensor_name}:")
 
-            for scenario_name, points in self.scenarios.items():
-                result = self.test_scenario(sensor_name, points, scenario_name)
-                all_results.append(result)
+            for j, (scenario_name, points) in enumerate(self.scenarios.items()):
+                if self.debug:
+                    print(
+                        f"         DEBUG: Points {points} -> Readings {all_readings[i, j]}"
+                    )
+
+                self._warn_if_not_decreasing(all_readings[i, j], points)
 
+                if self.debug:
+                    A, B, C = _calib(*all_readings[i, j], *points)
+                    print(f"         DEBUG: Params A={A:.2e}, B={B:.6f}, C={C:.2e}")
+
+                rms_error, r_squared = performance[j]
                 print(
-                    f"     {scenario_name:8}: RMS={result.rms_error*1000:.1f}μm, R²={result.r_squared:.4f}"
+                    f"     {scenario_name:8}: RMS={rms_error*1000:.1f}μm, R²={r_squared:.4f}"
                 )
 
-        self.results = all_results
-        print(f"\n✅ Analysis complete! {len(all_results)} test results generated.")
+        # Long-form results table with the ScenarioResult fields, built from the arrays
+        n_sensors, n_scenarios = self.rms.shape
+        range_spans = scenario_points[:, 2] - scenario_points[:, 0]
+        self.results = pd.DataFrame(
+            {
+                "scenario_name": list(self.scenarios.keys()) * n_sensors,
+                "points": list(self.scenarios.values()) * n_sensors,
+                "rms_error": self.rms.ravel(),
+                "r_squared": self.r2.ravel(),
+                "range_span": np.tile(range_spans, n_sensors),
+                "sensor_name": np.repeat(list(self.sensors.keys()), n_scenarios),
+            }
+        )
+        print(f"\n✅ Analysis complete! {len(self.results)} test results generated.")
 
     def calculate_scenario_statistics(self) -> List[ScenarioSummary]:
         """Calculate statistics for each scenario across all sensors"""
         summaries = []
+        scenario_names = list(self.scenarios.keys())
 
-        # Group results by scenario
-        scenario_groups = {}
-        for result in self.results:
-            if result.scenario_name not in scenario_groups:
-                scenario_groups[result.scenario_name] = []
-            scenario_groups[result.scenario_name].append(result)
+        # Failed calibrations (non-finite results) are left out of the statistics
+        rms = np.where(np.isfinite(self.rms), self.rms, np.nan)
+        r2 = np.where(np.isfinite(self.r2), self.r2, np.nan)
 
-        # Find reference performance (Standard scenario)
-        ref_rms_mean = np.mean([r.rms_error for r in scenario_groups["Standard"]])
+        rms_mean = np.nanmean(rms, axis=0)
+        rms_std = np.nanstd(rms, axis=0)
+        r2_mean = np.nanmean(r2, axis=0)
+        r2_std = np.nanstd(r2, axis=0)
 
-        for scenario_name, scenario_points in self.scenarios.items():
-            results = scenario_groups[scenario_name]
+        # Find reference performance (Standard scenario)
+        ref_rms_mean = np.mean(self.rms[:, scenario_names.index("Standard")])
 
-            rms_values = [r.rms_error for r in results if np.isfinite(r.rms_error)]
-            r2_values = [r.r_squared for r in results if np.isfinite(r.r_squared)]
+        # Calculate improvement vs reference
+        improvements = ((ref_rms_mean - rms_mean) / ref_rms_mean) * 100
 
-            if len(rms_values) == 0:
+        for j, (scenario_name, scenario_points) in enumerate(self.scenarios.items()):
+            if not np.isfinite(rms[:, j]).any():
                 continue
 
-            rms_mean = np.mean(rms_values)
-            rms_std = np.std(rms_values)
-            r2_mean = np.mean(r2_values)
-            r2_std = np.std(r2_values)
-
-            # Calculate improvement vs reference
-            improvement = ((ref_rms_mean - rms_mean) / ref_rms_mean) * 100
-
             summary = ScenarioSummary(
                 scenario_name=scenario_name,
                 points=scenario_points,
-                rms_mean=float(rms_mean),
-                rms_std=float(rms_std),
-                r2_mean=float(r2_mean),
-                r2_std=float(r2_std),
-                improvement_vs_ref=float(improvement),
+                rms_mean=float(rms_mean[j]),
+                rms_std=float(rms_std[j]),
+                r2_mean=float(r2_mean[j]),
+                r2_std=float(r2_std[j]),
+                improvement_vs_ref=float(improvements[j]),
                 range_span=scenario_points[2] - scenario_points[0],
             )
 
@@ -408,188 +744,185 @@ class RangeCalibrationAnalyzer:
         """Create summary table with statistics"""
         summaries = self.calculate_scenario_statistics()
 
-        # Create DataFrame
-        data = []
-        for summary in summaries:
-            data.append(
-                {
-                    "Scenario": summary.scenario_name,
-                    "Points (mm)": f"{summary.points[0]:.1f}, {summary.points[1]:.2f}, {summary.points[2]:.1f}",
-                    "Range Span (mm)": f"{summary.range_span:.1f}",
-                    "RMS Mean (μm)": f"{summary.rms_mean*1000:.1f}",
-                    "RMS STD (μm)": f"{summary.rms_std*1000:.1f}",
-                    "R² Mean": f"{summary.r2_mean:.4f}",
-                    "R² STD": f"{summary.r2_std:.4f}",
-                    "vs Reference (%)": f"{summary.improvement_vs_ref:+.1f}%",
-                }
-            )
-
-        df = pd.DataFrame(data)
+        # Create DataFrame column by column
+        df = pd.DataFrame(
+            {
+                "Scenario": [s.scenario_name for s in summaries],
+                "Points (mm)": [
+                    f"{s.points[0]:.1f}, {s.points[1]:.2f}, {s.points[2]:.1f}"
+                    for s in summaries
+                ],
+                "Range Span (mm)": [f"{s.range_span:.1f}" for s in summaries],
+                "RMS Mean (μm)": [f"{s.rms_mean*1000:.1f}" for s in summaries],
+                "RMS STD (μm)": [f"{s.rms_std*1000:.1f}" for s in summaries],
+                "R² Mean": [f"{s.r2_mean:.4f}" for s in summaries],
+                "R² STD": [f"{s.r2_std:.4f}" for s in summaries],
+                "vs Reference (%)": [
+                    f"{s.improvement_vs_ref:+.1f}%" for s in summaries
+                ],
+            }
+        )
         return df
 
     def plot_summary_analysis(self) -> None:
         """Create comprehensive summary plots"""
-        summaries = self.calculate_scenario_statistics()
-
-        # Create figure with 3 subplots
-        fig = plt.figure(figsize=(18, 12))
-
-        # Plot 1: RMS Error Comparison with Error Bars
-        ax1 = plt.subplot(2, 2, 1)
-
-        scenario_names = [s.scenario_name for s in summaries]
-        rms_means = [s.rms_mean * 1000 for s in summaries]  # Convert to μm
-        rms_stds = [s.rms_std * 1000 for s in summaries]
-        improvements = [s.improvement_vs_ref for s in summaries]
-
-        # Color coding by improvement
-        colors = [
-            "red" if imp < 0 else "green" if imp > 5 else "orange"
-            for imp in improvements
-        ]
-
-        bars = ax1.bar(
-            scenario_names,
-            rms_means,
-            yerr=rms_stds,
-            color=colors,
-            alpha=0.7,
-            capsize=5,
-            edgecolor="black",
-        )
+        plt = _import_pyplot()
+        import seaborn as sns
+
+        with plt.rc_context(_PLOT_STYLE):
+            summaries = self.calculate_scenario_statistics()
+
+            # Create figure with 3 subplots
+            fig = plt.figure(figsize=(18, 12))
+
+            # Plot 1: RMS Error Comparison with Error Bars
+            ax1 = plt.subplot(2, 2, 1)
+
+            scenario_names = [s.scenario_name for s in summaries]
+            rms_means = [s.rms_mean * 1000 for s in summaries]  # Convert to μm
+            rms_stds = [s.rms_std * 1000 for s in summaries]
+            improvements = [s.improvement_vs_ref for s in summaries]
+
+            # Color coding by improvement
+            colors = [
+                "red" if imp < 0 else "green" if imp > 5 else "orange"
+                for imp in improvements
+            ]
+
+            bars = ax1.bar(
+                scenario_names,
+                rms_means,
+                yerr=rms_stds,
+                color=colors,
+                alpha=0.7,
+                capsize=5,
+                edgecolor="black",
+            )
 
-        # Reference line
-        ref_rms = next(
-            s.rms_mean * 1000 for s in summaries if s.scenario_name == "Standard"
-        )
-        ax1.axhline(
-            y=ref_rms,
-            color="black",
-            linestyle="--",
-            linewidth=2,
-            label="Reference (Standard)",
-        )
+            # Reference line
+            ref_rms = next(
+                s.rms_mean * 1000 for s in summaries if s.scenario_name == "Standard"
+            )
+            ax1.axhline(
+                y=ref_rms,
+                color="black",
+                linestyle="--",
+                linewidth=2,
+                label="Reference (Standard)",
+            )
 
-        # Add improvement percentages on bars
-        for i, (bar, imp) in enumerate(zip(bars, improvements)):
-            height = bar.get_height() + rms_stds[i]
-            ax1.text(
-                bar.get_x() + bar.get_width() / 2.0,
-                height + max(rms_means) * 0.02,
-                f"{imp:+.1f}%",
-                ha="center",
-                va="bottom",
+            # Add improvement percentages on bars (placed above the error bars)
+            ax1.bar_label(
+                bars,
+                labels=[f"{imp:+.1f}%" for imp in improvements],
+                padding=3,
                 fontweight="bold",
             )
 
-        ax1.set_ylabel("RMS Error (μm)")
-        ax1.set_title("Calibration Accuracy by Range Scenario")
-        ax1.legend()
-        ax1.grid(True, alpha=0.3)
-        plt.setp(ax1.get_xticklabels(), rotation=45)
-
-        # Plot 2: R² Comparison
-        ax2 = plt.subplot(2, 2, 2)
-
-        r2_means = [s.r2_mean for s in summaries]
-        r2_stds = [s.r2_std for s in summaries]
-
-        bars2 = ax2.bar(
-            scenario_names,
-            r2_means,
-            yerr=r2_stds,
-            color=colors,
-            alpha=0.7,
-            capsize=5,
-            edgecolor="black",
-        )
+            ax1.set_ylabel("RMS Error (μm)")
+            ax1.set_title("Calibration Accuracy by Range Scenario")
+            ax1.legend()
+            ax1.grid(True, alpha=0.3)
+            plt.setp(ax1.get_xticklabels(), rotation=45)
+
+            # Plot 2: R² Comparison
+            ax2 = plt.subplot(2, 2, 2)
+
+            r2_means = [s.r2_mean for s in summaries]
+            r2_stds = [s.r2_std for s in summaries]
+
+            bars2 = ax2.bar(
+                scenario_names,
+                r2_means,
+                yerr=r2_stds,
+                color=colors,
+                alpha=0.7,
+                capsize=5,
+                edgecolor="black",
+            )
 
-        ax2.set_ylabel("R² Score")
-        ax2.set_title("Calibration Quality (R²)")
-        ax2.set_ylim(0.99, 1.0)
-        ax2.grid(True, alpha=0.3)
-        plt.setp(ax2.get_xticklabels(), rotation=45)
+            ax2.set_ylabel("R² Score")
+            ax2.set_title("Calibration Quality (R²)")
+            ax2.set_ylim(0.99, 1.0)
+            ax2.grid(True, alpha=0.3)
+            plt.setp(ax2.get_xticklabels(), rotation=45)
 
-        # Plot 3: Range Span vs Performance
-        ax3 = plt.subplot(2, 2, 3)
+            # Plot 3: Range Span vs Performance
+            ax3 = plt.subplot(2, 2, 3)
 
-        range_spans = [s.range_span for s in summaries]
+            range_spans = [s.range_span for s in summaries]
 
-        scatter = ax3.scatter(
-            range_spans,
-            rms_means,
-            c=improvements,
-            s=100,
-            cmap="RdYlGn",
-            edgecolors="black",
-        )
+            scatter = ax3.scatter(
+                range_spans,
+                rms_means,
+                c=improvements,
+                s=100,
+                cmap="RdYlGn",
+                edgecolors="black",
+            )
+
+            # Add scenario labels
+            for i, scenario in enumerate(scenario_names):
+                ax3.annotate(
+                    scenario,
+                    (range_spans[i], rms_means[i]),
+                    xytext=(5, 5),
+                    textcoords="offset points",
+                    fontsize=9,
+                )
 
-        # Add scenario labels
-        for i, scenario in enumerate(scenario_names):
-            ax3.annotate(
-                scenario,
-                (range_spans[i], rms_means[i]),
-                xytext=(5, 5),
-                textcoords="offset points",
-                fontsize=9,
+            ax3.set_xlabel("Range Span (mm)")
+            ax3.set_ylabel("RMS Error (μm)")
+            ax3.set_title("Range Span vs Accuracy")
+            ax3.grid(True, alpha=0.3)
+
+            # Colorbar
+            cbar = plt.colorbar(scatter, ax=ax3)
+            cbar.set_label("Improvement vs Reference (%)")
+
+            # Plot 4: Performance Matrix Heatmap
+            ax4 = plt.subplot(2, 2, 4)
+
+            # Create matrix data - RMS columns of the plotted scenarios
+            sensor_names = list(self.sensors.keys())
+            scenario_columns = [list(self.scenarios).index(n) for n in scenario_names]
+            matrix_data = self.rms[:, scenario_columns] * 1000.0
+
+            # Failed calibrations are inf - mask them so they don't break the colour scale
+            failed = ~np.isfinite(matrix_data)
+
+            # Create annotated heatmap
+            sns.heatmap(
+                matrix_data,
+                mask=failed,
+                annot=True,
+                fmt=".1f",
+                annot_kws={"color": "black", "fontsize": 8},
+                cmap="RdYlGn_r",
+                xticklabels=scenario_names,
+                yticklabels=sensor_names,
+                cbar_kws={"label": "RMS Error (μm)"},
+                ax=ax4,
             )
 
-        ax3.set_xlabel("Range Span (mm)")
-        ax3.set_ylabel("RMS Error (μm)")
-        ax3.set_title("Range Span vs Accuracy")
-        ax3.grid(True, alpha=0.3)
-
-        # Colorbar
-        cbar = plt.colorbar(scatter, ax=ax3)
-        cbar.set_label("Improvement vs Reference (%)")
-
-        # Plot 4: Performance Matrix Heatmap
-        ax4 = plt.subplot(2, 2, 4)
-
-        # Create matrix data
-        sensor_names = list(self.sensors.keys())
-        matrix_data = np.zeros((len(sensor_names), len(scenario_names)))
-
-        for i, sensor_name in enumerate(sensor_names):
-            for j, scenario_name in enumerate(scenario_names):
-                sensor_results = [
-                    r
-                    for r in self.results
-                    if r.sensor_name == sensor_name and r.scenario_name == scenario_name
-                ]
-                if sensor_results:
-                    matrix_data[i, j] = sensor_results[0].rms_error * 1000
-
-        # Create heatmap
-        im = ax4.imshow(matrix_data, cmap="RdYlGn_r", aspect="auto")
-
-        # Set ticks and labels
-        ax4.set_xticks(range(len(scenario_names)))
-        ax4.set_xticklabels(scenario_names, rotation=45)
-        ax4.set_yticks(range(len(sensor_names)))
-        ax4.set_yticklabels(sensor_names)
-
-        # Add text annotations
-        for i in range(len(sensor_names)):
-            for j in range(len(scenario_names)):
-                text = ax4.text(
-                    j,
-                    i,
+            # Keep failures visible - seaborn skips annotations on masked cells
+            for i, j in zip(*np.nonzero(failed)):
+                ax4.text(
+                    j + 0.5,
+                    i + 0.5,
                     f"{matrix_data[i, j]:.1f}",
                     ha="center",
                     va="center",
                     color="black",
                     fontsize=8,
                 )
+            plt.setp(ax4.get_xticklabels(), rotation=45)
+            plt.setp(ax4.get_yticklabels(), rotation=0)
 
-        ax4.set_title("Performance Matrix (RMS Error μm)")
-
-        # Colorbar for heatmap
-        cbar2 = plt.colorbar(im, ax=ax4)
-        cbar2.set_label("RMS Error (μm)")
+            ax4.set_title("Performance Matrix (RMS Error μm)")
 
-        plt.tight_layout()
-        plt.show()
+            plt.tight_layout()
+            plt.show()
 
     def print_results(self) -> None:
         """Print comprehensive results"""